@@ -0,0 +1,390 @@
+"""
+Shared build logic for Jira Installer
+PyInstaller build, version management and release packaging used by build.py
+"""
+
+import os
+import sys
+import subprocess
+import shutil
+import argparse
+import hashlib
+import importlib.util
+import mmap
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Matches the CURRENT_VERSION = "x.y.z" line; group 2 is the version itself
+_VERSION_RE = re.compile(r'(CURRENT_VERSION\s*=\s*")([^"]+)(")')
+_VERSION_BYTES_RE = re.compile(_VERSION_RE.pattern.encode())
+
+def _read_version():
+    """Read CURRENT_VERSION from jira_installer.py without importing it (importing starts the GUI)"""
+    try:
+        with open("jira_installer.py", 'r') as f:
+            match = _VERSION_RE.search(f.read())
+        return match.group(2) if match else None
+    except OSError:
+        return None
+
+# Version from main script, with a fallback if it cannot be read
+CURRENT_VERSION = _read_version() or "1.0.0"
+
+# Inputs that affect the PyInstaller output; a change to any of them forces a rebuild
+BUILD_INPUTS = [
+    "jira_installer.py",
+    "pyinstaller.spec",
+    "runtime_hook.py",
+    "file_version_info.txt",
+    "jira.ico",
+]
+FINGERPRINT_PATH = os.path.join("build", ".build_fingerprint")
+# Inputs of a release (the build inputs plus the bundled updater script, which is optional)
+RELEASE_INPUTS = BUILD_INPUTS + ["updater.py"]
+OPTIONAL_INPUTS = {"updater.py"}
+# Inputs are looked up in the project root first, then next to this script (where the spec and hooks live)
+BUILD_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+# Fingerprint of the inputs a release was packaged from, stored inside the release directory
+RELEASE_FINGERPRINT_NAME = ".fingerprint"
+EXE_PATH = "dist/jira_installer/jira_installer.exe"
+# Persistent PyInstaller cache, reused across builds unless --rebuild is given
+PYINSTALLER_CACHE_DIR = ".pyinstaller-cache"
+# Full PyInstaller output; only the tail is kept in memory for error reporting
+PYINSTALLER_LOG_PATH = "pyinstaller.log"
+# Directories not searched for __pycache__ folders when cleaning
+PYCACHE_SKIP_DIRS = {".git", "releases", "dist", "build", PYINSTALLER_CACHE_DIR}
+
+def run_command(cmd, shell=False, env=None):
+    """Run a command and return its decoded stdout, stderr and return code"""
+    result = subprocess.run(cmd, shell=shell, capture_output=True, env=env)
+    return (
+        result.stdout.decode('utf-8', 'replace'),
+        result.stderr.decode('utf-8', 'replace'),
+        result.returncode
+    )
+
+def run_command_streaming(cmd, log_path, env=None, tail_lines=200):
+    """Run a command, streaming its output to the console and log_path; return the output tail"""
+    tail = deque(maxlen=tail_lines)
+    # PyInstaller output can contain non-ASCII paths; don't depend on the locale codec (cp1252 on Windows)
+    with open(log_path, 'w', encoding='utf-8', errors='replace') as log_file:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            env=env
+        )
+        for line in proc.stdout:
+            log_file.write(line)
+            sys.stdout.write(line)
+            tail.append(line)
+        proc.stdout.close()
+        code = proc.wait()
+    return "".join(tail), "", code
+
+def check_pyinstaller():
+    """Check if PyInstaller is installed"""
+    # find_spec only consults the import finders; PyInstaller itself is not imported
+    if importlib.util.find_spec("PyInstaller") is not None:
+        return True
+
+    print("PyInstaller not found. Installing...")
+    stdout, stderr, code = run_command([sys.executable, "-m", "pip", "install", "pyinstaller"])
+    if code != 0:
+        print(f"Failed to install PyInstaller: {stderr}")
+        return False
+    return True
+
+def update_version_in_script(version):
+    """Update the CURRENT_VERSION in jira_installer.py"""
+    script_path = "jira_installer.py"
+
+    try:
+        # Patch the version in place when the old and new values have the same length;
+        # the memory-mapped file is searched directly, without reading it into a string
+        with open(script_path, 'r+b') as f, mmap.mmap(f.fileno(), 0) as mm:
+            match = _VERSION_BYTES_RE.search(mm)
+            if match:
+                current_version_in_file = match.group(2).decode()
+                new_version = version.encode()
+                if current_version_in_file == version:
+                    print(f"✅ Script version already set to {version}")
+                    return True
+                if len(new_version) == len(match.group(2)):
+                    mm[match.start(2):match.end(2)] = new_version
+                    mm.flush()
+                    print(f"✅ Updated version in script from {current_version_in_file} to {version}")
+                    return True
+
+        # Otherwise fall back to rewriting the file;
+        # newline='' keeps the script's CRLF line endings intact
+        with open(script_path, 'r', newline='') as f:
+            content = f.read()
+
+        # Nothing to do if the script already carries this version
+        if f'CURRENT_VERSION = "{version}"' in content:
+            print(f"✅ Script version already set to {version}")
+            return True
+
+        # Replace the version line (it should be something like CURRENT_VERSION = "x.x.x") in one pass
+        previous = []
+        def replace_version(match):
+            previous.append(match.group(2))
+            return f'{match.group(1)}{version}{match.group(3)}'
+
+        new_content, count = _VERSION_RE.subn(replace_version, content, count=1)
+
+        if count:
+            if new_content != content:
+                with open(script_path, 'w', newline='') as f:
+                    f.write(new_content)
+            print(f"✅ Updated version in script from {previous[0]} to {version}")
+            return True
+        else:
+            print(f"⚠️  Could not find CURRENT_VERSION line in script")
+            return False
+
+    except Exception as e:
+        print(f"❌ Failed to update version in script: {e}")
+        return False
+
+def _find_pycache_dirs(root):
+    """Return every __pycache__ directory under root, without descending into them or PYCACHE_SKIP_DIRS"""
+    found = []
+    for dirpath, dirs, _ in os.walk(root, topdown=True):
+        dirs[:] = [d for d in dirs if d not in PYCACHE_SKIP_DIRS]
+        if "__pycache__" in dirs:
+            found.append(os.path.join(dirpath, "__pycache__"))
+            dirs.remove("__pycache__")
+    return found
+
+def _resolve_input(name):
+    """Return where a build input lives (project root, then the build script's directory), or None"""
+    for path in (name, os.path.join(BUILD_SCRIPT_DIR, name)):
+        if os.path.isfile(path):
+            return path
+    return None
+
+def compute_fingerprint(paths=BUILD_INPUTS):
+    """Return a SHA256 hex digest over the contents of the given inputs (the build inputs by default)"""
+    digest = hashlib.sha256()
+    for name in paths:
+        # Hash the name, not the resolved path, so the fingerprint doesn't depend on the checkout location
+        digest.update(name.encode("utf-8"))
+        path = _resolve_input(name)
+        if path is None:
+            if name not in OPTIONAL_INPUTS:
+                print(f"⚠️  Build input not found: {name}")
+            digest.update(b"\0missing")
+            continue
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def read_fingerprint():
+    """Read the fingerprint stored by the last successful build, if any"""
+    try:
+        with open(FINGERPRINT_PATH, 'r') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def write_fingerprint(fingerprint):
+    """Store the fingerprint of a successful build"""
+    os.makedirs(os.path.dirname(FINGERPRINT_PATH), exist_ok=True)
+    with open(FINGERPRINT_PATH, 'w') as f:
+        f.write(fingerprint)
+
+def build_executable(version, clean=True, rebuild=False):
+    """Build the executables using PyInstaller"""
+    print(f"Building executable for version {version}...")
+
+    # Update version in script first
+    if not update_version_in_script(version):
+        return False
+
+    # Skip the whole build if nothing changed since the last successful one
+    fingerprint = compute_fingerprint()
+    if not rebuild and fingerprint == read_fingerprint() and os.path.exists(EXE_PATH):
+        print(f"✅ Sources unchanged since last build, reusing {EXE_PATH}")
+        return True
+
+    if clean:
+        # Clean previous builds and bytecode caches; each tree is removed with one rmtree,
+        # concurrently, rather than deleting cached .pyc files one by one
+        clean_dirs = ["dist", "build"] + _find_pycache_dirs(".")
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda d: shutil.rmtree(d, ignore_errors=True), clean_dirs))
+        print(f"Cleaned: {', '.join(clean_dirs)}")
+
+    # Run PyInstaller, keeping its cache in a persistent repo-local directory
+    cache_dir = os.path.abspath(PYINSTALLER_CACHE_DIR)
+    os.makedirs(cache_dir, exist_ok=True)
+    # --noconfirm: without a clean, dist/ still holds the previous output, and PyInstaller would
+    # otherwise prompt before replacing it (and abort, since its output is piped rather than a tty)
+    cmd = [sys.executable, "-m", "PyInstaller", "--noconfirm", "pyinstaller.spec"]
+    if rebuild:
+        cmd.append("--clean")
+    stdout, stderr, code = run_command_streaming(
+        cmd, PYINSTALLER_LOG_PATH, env={**os.environ, "PYINSTALLER_CONFIG_DIR": cache_dir}
+    )
+
+    if code != 0:
+        print(f"Build failed with code {code}")
+        print(f"Last lines of output (full log in {PYINSTALLER_LOG_PATH}):")
+        print(stdout)
+        return False
+
+    print("Build completed successfully!")
+
+    # Verify the executable was created
+    exe_path = EXE_PATH
+    try:
+        exe_stat = os.stat(exe_path)
+    except FileNotFoundError:
+        exe_stat = None
+    if exe_stat:
+        print(f"✅ Executable created: {exe_path} ({exe_stat.st_size:,}","bytes)")
+        write_fingerprint(fingerprint)
+        return True
+    else:
+        print("❌ Executable not found at expected location")
+        return False
+
+def is_release_fresh(version):
+    """Check whether the release for version exists and was packaged from the current inputs"""
+    # Compared by content, not mtime: a checkout can write the committed release exe after its sources
+    release_dir = os.path.join("releases", f"v{version}")
+    if not os.path.exists(os.path.join(release_dir, "jira_installer.exe")):
+        return False
+    try:
+        with open(os.path.join(release_dir, RELEASE_FINGERPRINT_NAME), 'r') as f:
+            stored = f.read().strip()
+    except OSError:
+        return False
+    return stored == compute_fingerprint(RELEASE_INPUTS)
+
+def _link_or_copy(src, dst):
+    """Hardlink src to dst, falling back to a copy across filesystems or without link support"""
+    if os.path.lexists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+def _scan_files(directory):
+    """Map file names to paths for the regular files in directory, or None if it does not exist"""
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name: entry.path for entry in it if entry.is_file()}
+    except FileNotFoundError:
+        return None
+
+def create_release_structure(version):
+    """Create release structure with executable and supporting files"""
+    print(f"Creating release structure for version {version}...")
+
+    # Copy main executable and supporting files; each source directory is listed once
+    main_dist_files = _scan_files("dist/jira_installer")
+    updater_dist_files = _scan_files("dist/updater") or {}
+    project_files = _scan_files(".") or {}
+
+    if main_dist_files is not None:
+        # Create versioned release directory
+        release_dir = os.path.join("releases", f"v{version}")
+        os.makedirs(release_dir, exist_ok=True)
+
+        # Collect the files to copy; the copies are independent so they run concurrently.
+        # The built executables are never modified afterwards, so they are hardlinked.
+        copies = []
+
+        main_exe_dst = os.path.join(release_dir, "jira_installer.exe")
+        if "jira_installer.exe" in main_dist_files:
+            copies.append((main_dist_files["jira_installer.exe"], main_exe_dst, _link_or_copy, f"✅ Copied main executable to {main_exe_dst}"))
+
+        updater_exe_dst = os.path.join(release_dir, "updater.exe")
+        if "updater.exe" in updater_dist_files:
+            copies.append((updater_dist_files["updater.exe"], updater_exe_dst, _link_or_copy, f"✅ Copied updater executable to {updater_exe_dst}"))
+        else:
+            print(f"⚠️  Updater executable not found: {os.path.join('dist', 'updater', 'updater.exe')}")
+
+        # Copy icon if needed
+        if "jira.ico" in project_files:
+            copies.append((project_files["jira.ico"], os.path.join(release_dir, "jira.ico"), shutil.copy2, f"✅ Copied icon to {release_dir}"))
+
+        # Copy updater script (fallback for development)
+        if "updater.py" in project_files:
+            copies.append((project_files["updater.py"], os.path.join(release_dir, "updater.py"), shutil.copy2, f"✅ Copied updater script to {release_dir}"))
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda copy: copy[2](copy[0], copy[1]), copies))
+        for _, _, _, message in copies:
+            print(message)
+
+        # Record what this release was built from, for is_release_fresh
+        with open(os.path.join(release_dir, RELEASE_FINGERPRINT_NAME), 'w') as f:
+            f.write(compute_fingerprint(RELEASE_INPUTS))
+
+        print(f"📦 Release created in: {release_dir}")
+        return release_dir
+
+    return None
+
+def main():
+    """Main build process"""
+    parser = argparse.ArgumentParser(description="Build Jira Installer")
+    parser.add_argument("--version", default=None, help="Version number (overrides script version)")
+    parser.add_argument("--no-clean", action="store_true", help="Skip cleaning build directories")
+    parser.add_argument("--quick", action="store_true", help="Quick build (skip cleaning)")
+    parser.add_argument("--rebuild", action="store_true", help="Discard PyInstaller caches and rebuild from scratch")
+    parser.add_argument("--force", action="store_true", help="Build even if the release is already up to date")
+
+    args = parser.parse_args()
+
+    print("Jira Installer Build Script")
+    print("=" * 40)
+
+    # Check if we're in the right directory
+    if not os.path.exists("jira_installer.py"):
+        print("Error: jira_installer.py not found. Please run this script from the project root.")
+        sys.exit(1)
+
+    # Determine version to use
+    if args.version:
+        version = args.version
+        print(f"Using specified version: {version}")
+    else:
+        # Read version from main script
+        version = _read_version()
+        if version:
+            print(f"Using version from script: {version}")
+        else:
+            version = "1.0.0"
+            print(f"Using fallback version: {version}")
+
+    # Nothing to do if the release was packaged from the current inputs
+    if not (args.force or args.rebuild) and is_release_fresh(version):
+        print(f"✅ Release v{version} is up to date, nothing to build (use --force to rebuild)")
+        return
+
+    # Check PyInstaller
+    if not check_pyinstaller():
+        sys.exit(1)
+
+    # Build executable
+    if not build_executable(version, clean=not (args.no_clean or args.quick), rebuild=args.rebuild):
+        sys.exit(1)
+
+    # Create release structure
+    release_dir = create_release_structure(version)
+    if release_dir:
+        print(f"\n✅ Release ready in: {release_dir}")
+        print("📦 You can now create a GitHub release with the executable.")
+    else:
+        print("❌ Warning: Release structure creation failed.")
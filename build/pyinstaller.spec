@@ -79,6 +79,9 @@ else:
     binaries = []
     win_options = {}
 
+# Strip symbol tables from the bundled binaries (not supported for Windows binaries)
+strip_binaries = os.name != 'nt'
+
 a = Analysis(
     ['jira_installer.py'],
     pathex=[],
@@ -102,6 +105,8 @@ a = Analysis(
     ],
     cipher=block_cipher,
     noarchive=False,
+    # Byte-compile with -OO semantics: asserts and docstrings are dropped for a smaller, faster-loading archive
+    optimize=2,
     **win_options
 )
 
@@ -116,7 +121,7 @@ exe = EXE(
     name='jira_installer',
     debug=False,
     bootloader_ignore_signals=False,
-    strip=False,
+    strip=strip_binaries,
     upx=True,
     upx_exclude=[
         'vcruntime*.dll',
@@ -143,7 +148,7 @@ coll = COLLECT(
     a.binaries,
     a.zipfiles,
     a.datas,
-    strip=False,
+    strip=strip_binaries,
     upx=True,
     upx_exclude=[],
     name='jira_installer'
@@ -5,15 +5,27 @@ import subprocess
 import os
 import urllib.request
 import tarfile
+import glob
 import threading
-import queue
+import collections
 import sys
 import time
 import json
+import io
 import hashlib
 import tempfile
 import shutil
 import platform
+import re
+import concurrent.futures
+import queue
+from functools import lru_cache
+
+try:
+    # Optional: the Docker SDK talks to the daemon socket directly instead of spawning the CLI
+    import docker as docker_sdk
+except ImportError:
+    docker_sdk = None
 
 # Constants
 JDBC_VERSION = "9.4.0"
@@ -21,31 +33,35 @@ JDBC_TAR = f"mysql-connector-j-{JDBC_VERSION}.tar.gz"
 JDBC_URL = f"https://dev.mysql.com/get/Downloads/Connector-J/{JDBC_TAR}"
 JDBC_FOLDER = f"mysql-connector-j-{JDBC_VERSION}"
 
+# Leading major version of a Jira version string ("10.2.6" -> 10)
+VERSION_RE = re.compile(r"^(\d+)\.")
+
 # Update System Constants
 CURRENT_VERSION = "1.0.1"
 GITHUB_REPO = "tugasky/Xray-Support-DockerJiraInstaller"
 GITHUB_API_URL = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
 UPDATE_BACKUP_EXT = ".backup"
 UPDATE_TEMP_EXT = ".tmp"
+UPDATE_CACHE_PATH = os.path.join(tempfile.gettempdir(), "jira_installer_update_cache.json")
+UPDATE_CACHE_TTL = 3600  # Seconds during which a previous check is reused without contacting GitHub
 
 # ---------- Update System Functions ----------
+@lru_cache(maxsize=64)
+def _parse_version(version):
+    """Parse a dotted version string into a tuple of ints, ignoring trailing zero components"""
+    parts = [int(x) for x in version.split('.')]
+    # Drop trailing zeros so "1.0" and "1.0.0" compare equal
+    while parts and parts[-1] == 0:
+        parts.pop()
+    return tuple(parts)
+
+@lru_cache(maxsize=128)
 def compare_versions(version1, version2):
     """Compare two version strings. Returns -1 if version1 < version2, 0 if equal, 1 if version1 > version2"""
     try:
-        v1_parts = [int(x) for x in version1.split('.')]
-        v2_parts = [int(x) for x in version2.split('.')]
-
-        # Pad the shorter version with zeros
-        max_len = max(len(v1_parts), len(v2_parts))
-        v1_parts.extend([0] * (max_len - len(v1_parts)))
-        v2_parts.extend([0] * (max_len - len(v2_parts)))
-
-        for i in range(max_len):
-            if v1_parts[i] < v2_parts[i]:
-                return -1
-            elif v1_parts[i] > v2_parts[i]:
-                return 1
-        return 0
+        v1_parts = _parse_version(version1)
+        v2_parts = _parse_version(version2)
+        return (v1_parts > v2_parts) - (v1_parts < v2_parts)
     except (ValueError, AttributeError):
         # Fallback to string comparison if version format is unexpected
         if version1 < version2:
@@ -54,19 +70,68 @@ def compare_versions(version1, version2):
             return 1
         return 0
 
+def load_update_cache():
+    """Load the release metadata cached by the previous update check"""
+    try:
+        with open(UPDATE_CACHE_PATH, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def save_update_cache(cache):
+    """Store release metadata for the next update check"""
+    try:
+        with open(UPDATE_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        log(f"Could not save update cache: {e}")
+
 def check_for_updates():
     """Check if updates are available on GitHub"""
     try:
         log(f"Checking for updates... (current version: {CURRENT_VERSION})")
 
-        # Create request with user agent to avoid GitHub API restrictions
-        req = urllib.request.Request(
-            GITHUB_API_URL,
-            headers={'User-Agent': 'Jira-Installer/1.0'}
-        )
+        cache = load_update_cache()
+        cached_data = cache.get('release_data')
 
-        with urllib.request.urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode('utf-8'))
+        if cached_data and time.time() - cache.get('fetched_at', 0) < UPDATE_CACHE_TTL:
+            # Checked recently; reuse the result without contacting GitHub
+            data = cached_data
+        else:
+            # Create request with user agent to avoid GitHub API restrictions
+            headers = {'User-Agent': 'Jira-Installer/1.0'}
+            if cached_data:
+                # Conditional request: GitHub answers 304 with no body (and no rate-limit cost) if unchanged
+                if cache.get('etag'):
+                    headers['If-None-Match'] = cache['etag']
+                if cache.get('last_modified'):
+                    headers['If-Modified-Since'] = cache['last_modified']
+            req = urllib.request.Request(GITHUB_API_URL, headers=headers)
+
+            try:
+                with urllib.request.urlopen(req, timeout=10) as response:
+                    # Parse straight from the response stream instead of buffering bytes and a str copy
+                    data = json.load(io.TextIOWrapper(response, encoding='utf-8'))
+                    cache = {
+                        'etag': response.headers.get('ETag'),
+                        'last_modified': response.headers.get('Last-Modified'),
+                        # Only the fields needed to report and download an update are kept
+                        'release_data': {
+                            'tag_name': data.get('tag_name', ''),
+                            'assets': [
+                                {'name': asset.get('name', ''), 'browser_download_url': asset.get('browser_download_url')}
+                                for asset in data.get('assets', [])
+                            ],
+                        },
+                    }
+            except urllib.error.HTTPError as e:
+                if e.code != 304 or not cached_data:
+                    raise
+                data = cached_data
+
+            cache['fetched_at'] = time.time()
+            save_update_cache(cache)
 
         latest_version = data.get('tag_name', '').lstrip('v')  # Remove 'v' prefix if present
 
@@ -96,8 +161,9 @@ def check_for_updates():
         log(f"Unexpected error checking for updates: {e}")
         return None
 
+@lru_cache(maxsize=1)
 def get_executable_path():
-    """Get the path to the current executable"""
+    """Get the path to the current executable (fixed for the lifetime of the process)"""
     if getattr(sys, 'frozen', False):
         # Running as PyInstaller executable
         return sys.executable
@@ -130,9 +196,8 @@ def restore_backup():
         backup_path = current_path + UPDATE_BACKUP_EXT
 
         if os.path.exists(backup_path):
-            if os.path.exists(current_path):
-                os.remove(current_path)
-            shutil.move(backup_path, current_path)
+            # Atomic replace: current_path never goes missing if we are interrupted
+            os.replace(backup_path, current_path)
             log("Restored from backup successfully.")
             return True
         else:
@@ -159,7 +224,8 @@ def download_update(download_url, temp_path):
 
             with open(temp_path, 'wb') as temp_file:
                 downloaded = 0
-                block_size = 8192
+                block_size = 1 << 20  # 1 MiB reads
+                last_progress = -1
 
                 while True:
                     buffer = response.read(block_size)
@@ -171,7 +237,10 @@ def download_update(download_url, temp_path):
 
                     if total_size > 0:
                         progress = int((downloaded / total_size) * 100)
-                        run_on_ui(update_download_progress, progress)
+                        # Only post to the UI when the displayed percentage changes
+                        if progress != last_progress:
+                            last_progress = progress
+                            run_on_ui(update_download_progress, progress)
 
         log(f"Download completed: {temp_path}")
         return True
@@ -310,19 +379,17 @@ def install_update(temp_path):
         log(f"Failed to install update: {e}")
         return False
 
+def _is_target_asset(asset):
+    """Check whether a release asset is the installer executable"""
+    asset_name = asset.get('name', '').lower()
+    return asset_name.endswith('.exe') or 'jira-installer' in asset_name
+
 def perform_update(update_info):
     """Perform the complete update process"""
     try:
-        # Get download URL for the executable
+        # Get download URL for the executable (first matching asset)
         assets = update_info.get('release_data', {}).get('assets', [])
-        download_url = None
-
-        # Look for executable file
-        for asset in assets:
-            asset_name = asset.get('name', '').lower()
-            if asset_name.endswith('.exe') or 'jira-installer' in asset_name:
-                download_url = asset.get('browser_download_url')
-                break
+        download_url = next((asset.get('browser_download_url') for asset in assets if _is_target_asset(asset)), None)
 
         if not download_url:
             log("No suitable update file found in release.")
@@ -397,23 +464,59 @@ def check_and_prompt_update():
         else:
             messagebox.showinfo("No Updates", "You have the latest version installed.")
 
-    threading.Thread(target=task).start()
+    if is_busy():
+        messagebox.showinfo("Busy", "Another task is still running. Please wait for it to finish.")
+        return
+    submit_task(task)
 
 # ---------- Helper functions ----------
-# UI communication queue (producer from worker threads, consumer on main thread)
-ui_queue = queue.Queue()
+# UI communication queue (producer from worker threads, consumer on main thread).
+# deque.append/popleft are thread-safe, so no extra locking is needed.
+# Posting an item wakes the main thread with a <<UIWork>> virtual event; nothing polls the queue.
+ui_queue = collections.deque()
+ui_wake_pending = False  # A <<UIWork>> event is already on its way; no need to generate another
+# Log lines are buffered separately and written to the Text widget in one insert per interval.
+# Bounded: if the UI falls far behind, the oldest unwritten lines are dropped instead of piling up.
+LOG_BUFFER_LINES = 5000
+LOG_FLUSH_INTERVAL_MS = 100
+log_queue = collections.deque(maxlen=LOG_BUFFER_LINES)
+log_flush_pending = False  # A flush is already requested; nothing to do until it runs
 current_steps = []
 step_labels = []
+# Step display model: ("pending" | "running" | "done" | "error", text suffix) per step.
+# set_step_* only update this; redraw_steps applies it to the labels once the UI is idle.
+steps_state = []
+rendered_steps = []  # Last (text, fg, font, bg) applied to each label
+steps_redraw_pending = False
 overall_steps_total = 0
 overall_steps_done = 0
 install_start_time = None
-current_step_start_time = None
-elapsed_job_id = None
+step_start_times = {}  # Step index -> start time; pulls can run two steps at once
+elapsed_timer_running = False
+ELAPSED_UPDATE_MS = 1000
 current_step_index = None
+progress_active = 0  # Operations currently showing the indeterminate progress bar
+
+def post_ui(item):
+    # Enqueue an item for ui_drain and wake the main thread (event_generate is safe from any thread)
+    global ui_wake_pending
+    ui_queue.append(item)
+    if not ui_wake_pending:
+        ui_wake_pending = True
+        try:
+            root.event_generate("<<UIWork>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            # Window closing (or not created yet); the next post will try again
+            ui_wake_pending = False
 
 def log(msg):
-    # Always enqueue log messages; main thread drains and writes to the Text widget
-    ui_queue.put(("log", msg))
+    # Buffer the line; the first one after a flush asks the main thread (via ui_drain) to schedule the next.
+    # No timer runs while nothing is logged.
+    global log_flush_pending
+    log_queue.append(msg)
+    if not log_flush_pending:
+        log_flush_pending = True
+        post_ui(("flush_logs",))
 
 def run_on_ui(func, *args, **kwargs):
     # If we're on the main thread, call directly; otherwise enqueue
@@ -423,7 +526,7 @@ def run_on_ui(func, *args, **kwargs):
         except Exception:
             pass
     else:
-        ui_queue.put(("call", func, args, kwargs))
+        post_ui(("call", func, args, kwargs))
 
 def show_error_ui(title, message):
     # If on main thread, show directly; otherwise enqueue
@@ -433,7 +536,7 @@ def show_error_ui(title, message):
         except Exception:
             pass
     else:
-        ui_queue.put(("error", title, message))
+        post_ui(("error", title, message))
 
 def ask_yes_no_on_ui(title, message):
     # If on main thread, ask directly; otherwise enqueue and wait
@@ -444,68 +547,137 @@ def ask_yes_no_on_ui(title, message):
             return False
     result_container = {}
     done = threading.Event()
-    ui_queue.put(("askyesno", title, message, result_container, done))
+    post_ui(("askyesno", title, message, result_container, done))
     done.wait()
     return result_container.get("result", False)
 
+# Single long-lived worker thread: installs and update checks run one at a time, in submission order
+_TASK_QUEUE = queue.Queue()
+_tasks_pending = 0
+_tasks_pending_lock = threading.Lock()
+
+def submit_task(func, *args, **kwargs):
+    """Queue func to run on the background worker thread"""
+    global _tasks_pending
+    with _tasks_pending_lock:
+        _tasks_pending += 1
+    run_on_ui(update_busy_indicator)
+    _TASK_QUEUE.put((func, args, kwargs))
+
+def is_busy():
+    # True while a task is queued or running
+    return _tasks_pending > 0
+
+def update_busy_indicator():
+    busy_label.config(text="Working..." if is_busy() else "")
+
+def _task_worker():
+    global _tasks_pending
+    while True:
+        func, args, kwargs = _TASK_QUEUE.get()
+        try:
+            func(*args, **kwargs)
+        except Exception as e:
+            log(f"[FAIL] Background task failed: {e}")
+        finally:
+            with _tasks_pending_lock:
+                _tasks_pending -= 1
+            run_on_ui(update_busy_indicator)
+
+threading.Thread(target=_task_worker, name="task-worker", daemon=True).start()
+
+def _build_win_subprocess_kwargs():
+    # Windows: hide the console window of spawned processes (docker, etc.)
+    if os.name != 'nt':
+        return {}
+    try:
+        si = subprocess.STARTUPINFO()
+        si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        si.dwFlags |= subprocess.STARTF_USESTDHANDLES
+        return {"startupinfo": si, "creationflags": getattr(subprocess, "CREATE_NO_WINDOW", 0x08000000)}
+    except Exception:
+        return {}
+
+# Built once at import; subprocess copies the STARTUPINFO per call, so it is safe to share
+_WIN_SUBPROCESS_KWARGS = _build_win_subprocess_kwargs()
+
+def _run(cmd, **extra):
+    # subprocess.run with the shared Windows kwargs applied
+    return subprocess.run(cmd, **_WIN_SUBPROCESS_KWARGS, **extra)
+
+@lru_cache(maxsize=128)
 def to_docker_host_path(host_path):
-    # Convert a Windows path to a Docker-friendly path with quoting if needed
+    # Convert a Windows path to a Docker-friendly path with quoting if needed.
+    # Memoized: the installer never changes its working directory, so relative paths resolve the same way each time.
     abs_path = os.path.abspath(host_path)
     # Do NOT quote; subprocess passes args directly and Docker handles spaces.
     # Quoting here breaks Windows volume parsing (drive colon + container colon).
     return abs_path
 
 def safe_extract_tar(tar: tarfile.TarFile, path: str = "."):
+    # Works for stream-mode archives ('r|gz') too: members are visited once, in order, without seeking
+    if hasattr(tarfile, 'data_filter'):
+        # Python 3.12+ (and security backports): the stdlib 'data' filter rejects unsafe members while extracting
+        tar.extractall(path, filter='data')
+        return
+    # Python without extraction filters: validate each member just before extracting it
     base = os.path.abspath(path)
-    for member in tar.getmembers():
+    for member in tar:
         member_path = os.path.abspath(os.path.join(path, member.name))
         if not member_path.startswith(base + os.sep) and member_path != base:
             raise Exception("Blocked path traversal in tar file")
-    tar.extractall(path)
+        tar.extract(member, path)
+
+def find_jdbc_jar(jdbc_folder: str):
+    # The connector jar sits at the top of the folder; iglob checks there first and stops at the first match
+    return next(glob.iglob(os.path.join(glob.escape(jdbc_folder), "**", "*.jar"), recursive=True), None)
+
+def get_container_health(container_name: str) -> str:
+    # Health status from the image's HEALTHCHECK; empty if it defines none
+    result = _run([
+        "docker", "inspect", "--format", "{{if .State.Health}}{{.State.Health.Status}}{{end}}", container_name
+    ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        return ""
+    return result.stdout.decode().strip()
 
 def wait_for_mysql_ready(container_name: str, root_password: str = "root_password", timeout_seconds: int = 120, poll_interval_seconds: float = 2.0) -> bool:
     start_time = time.time()
+    # Poll quickly at first (MySQL is often up within seconds), backing off to poll_interval_seconds
+    interval = 0.2
+    has_healthcheck = True
     while time.time() - start_time < timeout_seconds:
         try:
-            # Use mysqladmin ping; --silent returns exit code 0 when alive
-            kwargs = {}
-            if os.name == 'nt':
-                try:
-                    si = subprocess.STARTUPINFO()
-                    si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                    kwargs["startupinfo"] = si
-                    kwargs["creationflags"] = getattr(subprocess, "CREATE_NO_WINDOW", 0x08000000)
-                except Exception:
-                    pass
-            result = subprocess.run([
-                "docker", "exec", container_name, "bash", "-c",
-                f"mysqladmin ping -h 127.0.0.1 -uroot -p{root_password} --silent"
-            ], stdout=subprocess.PIPE, stderr=subprocess.PIPE, **kwargs)
-            if result.returncode == 0:
+            health = get_container_health(container_name) if has_healthcheck else ""
+            if health == "healthy":
                 return True
+            if not health:
+                # No HEALTHCHECK defined: use mysqladmin ping; --silent returns exit code 0 when alive.
+                # Exec it directly rather than through a shell inside the container.
+                has_healthcheck = False
+                result = _run([
+                    "docker", "exec", container_name,
+                    "mysqladmin", "ping", "-h", "127.0.0.1", "-uroot", f"-p{root_password}", "--silent"
+                ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                if result.returncode == 0:
+                    return True
         except Exception:
             pass
-        time.sleep(poll_interval_seconds)
+        time.sleep(interval)
+        interval = min(interval * 1.5, poll_interval_seconds)
     return False
 
 def clear_logs():
     log_text.delete(1.0, tk.END)
 
-def run_cmd_list(cmd_list, fatal=False):
+def run_cmd_list(cmd_list, fatal=False, capture=True, decode=True):
+    """Run a command; returns its stripped output (True when capture=False), or None on failure"""
     try:
-        kwargs = {}
-        if os.name == 'nt':
-            try:
-                si = subprocess.STARTUPINFO()
-                si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                si.dwFlags |= subprocess.STARTF_USESTDHANDLES
-                kwargs["startupinfo"] = si
-                kwargs["creationflags"] = getattr(subprocess, "CREATE_NO_WINDOW", 0x08000000)
-            except Exception:
-                pass
-        result = subprocess.run(cmd_list, check=True,
-                                stdout=subprocess.PIPE, stderr=subprocess.PIPE, **kwargs)
-        return result.stdout.decode().strip()
+        # Discard stdout when the caller only needs success/failure; stderr is still kept for the error message
+        result = _run(cmd_list, check=True, stdout=subprocess.PIPE if capture else subprocess.DEVNULL, stderr=subprocess.PIPE)
+        if not capture:
+            return True
+        return result.stdout.decode().strip() if decode else result.stdout.strip()
     except subprocess.CalledProcessError as e:
         msg = e.stderr.decode().strip()
         log(f"Error: {msg}")
@@ -515,34 +687,14 @@ def run_cmd_list(cmd_list, fatal=False):
 
 def check_docker_installed():
     try:
-        kwargs = {}
-        if os.name == 'nt':
-            try:
-                si = subprocess.STARTUPINFO()
-                si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                kwargs["startupinfo"] = si
-                kwargs["creationflags"] = getattr(subprocess, "CREATE_NO_WINDOW", 0x08000000)
-            except Exception:
-                pass
-        subprocess.run(["docker", "--version"], check=True,
-                       stdout=subprocess.PIPE, stderr=subprocess.PIPE, **kwargs)
+        _run(["docker", "--version"], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         return True
     except (subprocess.CalledProcessError, FileNotFoundError):
         return False
 
 def check_docker_running():
     try:
-        kwargs = {}
-        if os.name == 'nt':
-            try:
-                si = subprocess.STARTUPINFO()
-                si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                kwargs["startupinfo"] = si
-                kwargs["creationflags"] = getattr(subprocess, "CREATE_NO_WINDOW", 0x08000000)
-            except Exception:
-                pass
-        subprocess.run(["docker", "info"], check=True,
-                       stdout=subprocess.PIPE, stderr=subprocess.PIPE, **kwargs)
+        _run(["docker", "info"], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         return True
     except subprocess.CalledProcessError:
         return False
@@ -573,47 +725,198 @@ def ensure_docker_ready(root_window):
         root_window.destroy()
         sys.exit(1)
 
-def check_container_exists(name):
-    containers = run_cmd_list(["docker", "ps", "-a", "--format", "{{.Names}}"]) or ""
-    return name in containers.splitlines()
+# Shared Docker SDK client (only when the optional docker package is installed)
+_docker_client = None
+_docker_client_resolved = False
+_docker_client_lock = threading.Lock()
 
-def check_volume_exists(name):
-    volumes = run_cmd_list(["docker", "volume", "ls", "--format", "{{.Name}}"]) or ""
-    return name in volumes.splitlines()
+def _docker_cli_endpoint():
+    """Return the daemon address of the docker CLI's active context (honours DOCKER_CONTEXT/DOCKER_HOST), or None"""
+    try:
+        result = _run(["docker", "context", "inspect", "--format", "{{.Endpoints.docker.Host}}"], check=True, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+    return result.stdout.decode().strip() or None
+
+def get_docker_client():
+    """Return the shared Docker SDK client, or None to fall back to the docker CLI"""
+    global _docker_client, _docker_client_resolved
+    if docker_sdk is None:
+        return None
+    with _docker_client_lock:
+        if not _docker_client_resolved:
+            # Talk to the same daemon as the CLI run/cp/exec calls (desktop-linux, colima, rootless...),
+            # not whatever from_env() would guess
+            endpoint = _docker_cli_endpoint()
+            if endpoint is None:
+                # CLI unavailable right now; retry on the next call
+                return None
+            _docker_client_resolved = True
+            # TLS and ssh endpoints need CLI-managed credentials, so leave those to the CLI
+            if endpoint.startswith(("unix://", "npipe://")):
+                try:
+                    _docker_client = docker_sdk.DockerClient(base_url=endpoint)
+                except Exception:
+                    _docker_client = None
+        return _docker_client
+
+# Full docker listings, used when no pre-checked names are available
+DOCKER_LISTING_CMDS = {
+    "containers": ["docker", "ps", "-a", "--format", "{{.Names}}"],
+    "volumes": ["docker", "volume", "ls", "--format", "{{.Name}}"],
+}
+
+def _sdk_listing(client, key):
+    # Low-level API calls: one HTTP request each over the client's pooled connection
+    if key == "containers":
+        return {name.lstrip("/") for c in client.api.containers(all=True) for name in c.get("Names") or ()}
+    return {v["Name"] for v in client.api.volumes().get("Volumes") or ()}
+
+def _docker_listing(key):
+    client = get_docker_client()
+    if client is not None:
+        try:
+            return _sdk_listing(client, key)
+        except Exception:
+            pass
+    return set((run_cmd_list(DOCKER_LISTING_CMDS[key]) or "").splitlines())
+
+# One inspect call per resource type covers all requested names; missing names are reported on stderr
+PRECHECK_INSPECT_CMDS = {
+    "containers": ["docker", "container", "inspect", "--format", "{{.Name}}"],
+    "volumes": ["docker", "volume", "inspect", "--format", "{{.Name}}"],
+    "networks": ["docker", "network", "inspect", "--format", "{{.Name}}"],
+}
+
+def _inspect_existing(kind, names):
+    client = get_docker_client()
+    if client is not None:
+        inspect = {
+            "containers": client.api.inspect_container,
+            "volumes": client.api.inspect_volume,
+            "networks": client.api.inspect_network,
+        }[kind]
+        try:
+            existing = set()
+            for name in names:
+                try:
+                    # The daemon also resolves ID prefixes; only an exact name match counts, as on the CLI path
+                    if inspect(name).get("Name", "").lstrip("/") == name:
+                        existing.add(name)
+                except docker_sdk.errors.NotFound:
+                    pass
+            return existing
+        except Exception:
+            pass
+    result = _run(PRECHECK_INSPECT_CMDS[kind] + list(names), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    # Container names come back as "/name"; compare against the requested names (not IDs or prefixes)
+    found = {line.strip().lstrip("/") for line in result.stdout.decode().splitlines()}
+    return found.intersection(names)
+
+def precheck_resources(names):
+    """Check which of the named resources exist, e.g. {"containers": [...], "volumes": [...], "networks": [...]}; returns {kind: set of existing names}"""
+    names = {kind: [n for n in wanted if n] for kind, wanted in names.items()}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(PRECHECK_INSPECT_CMDS)) as executor:
+        futures = {kind: executor.submit(_inspect_existing, kind, wanted) for kind, wanted in names.items() if wanted}
+        return {kind: futures[kind].result() if kind in futures else set() for kind in names}
+
+def _parallel_docker_probe(resources):
+    """Run the docker pre-flight checks concurrently: installed/running flags plus which of the given resources exist"""
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+        installed = executor.submit(check_docker_installed)
+        running = executor.submit(check_docker_running)
+        existing = executor.submit(precheck_resources, resources)
+        probe = {"installed": installed.result(), "running": running.result()}
+        probe.update(existing.result())
+    return probe
+
+def check_container_exists(name, containers=None):
+    if containers is None:
+        containers = _docker_listing("containers")
+    return name in containers
+
+def check_volume_exists(name, volumes=None):
+    if volumes is None:
+        volumes = _docker_listing("volumes")
+    return name in volumes
+
+def docker_op(cmd, sdk_call, fatal=False):
+    """Run a docker mutation as one SDK request when the client is available, else via the CLI; returns None on failure"""
+    client = get_docker_client()
+    if client is not None:
+        try:
+            sdk_call(client.api)
+            return True
+        except Exception:
+            # Let the CLI retry; it reports the failure the usual way
+            pass
+    return run_cmd_list(cmd, fatal=fatal, capture=False)
+
+def ensure_network(name, exists=None):
+    """Create the docker network unless it already exists; returns False if it could not be created"""
+    if exists is None:
+        # The inspect exit code tells whether the network exists, without listing every network
+        exists = _run(["docker", "network", "inspect", name], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode == 0
+    if not exists:
+        log(f"Creating docker network '{name}'...")
+        client = get_docker_client()
+        if client is not None:
+            try:
+                client.api.create_network(name, driver="bridge")
+                return True
+            except Exception as e:
+                if "already exists" in str(e):
+                    return True
+        cmd = ["docker", "network", "create", "--driver", "bridge", name]
+        result = _run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        msg = result.stderr.decode().strip()
+        # "already exists" means it was created in the meantime, which is just as good
+        if result.returncode == 0 or "already exists" in msg:
+            return True
+        log(f"Error: {msg}")
+        show_error_ui("Error", f"Command failed:\n{' '.join(cmd)}\n\n{msg}")
+        return False
+    log(f"'{name}' already exists.")
+    return True
 
 def delete_volume(name):
     try:
-        run_cmd_list(["docker", "volume", "rm", name], fatal=True)
+        docker_op(["docker", "volume", "rm", name], lambda api: api.remove_volume(name), fatal=True)
         log(f"Deleted existing volume '{name}'.")
         return True
     except Exception as e:
         log(f"Failed to delete volume '{name}': {e}")
         return False
 
+# "<name> <ports>" lines from docker ps, and the host ports published in a Ports column
+# (e.g. "0.0.0.0:8080->8080/tcp, [::]:8080->8080/tcp")
+_PS_PORTS_LINE_RE = re.compile(r'^(?P<name>\S+)[ \t]+(?P<ports>.*)$', re.M)
+_HOST_PORT_RE = re.compile(r':(\d+)->')
+
 def stop_container_using_port(port):
     ports_info = run_cmd_list(["docker", "ps", "--format", "{{.Names}} {{.Ports}}"]) or ""
-    for line in ports_info.splitlines():
-        if '->' in line:
-            name = line.split()[0]
-            try:
-                p = int(line.split('->')[0].split(':')[-1])
-                if p == port:
-                    # Ask the user before stopping
-                    if ask_yes_no_on_ui("Port in use", f"Container '{name}' is using port {port}. Stop it?"):
-                        log(f"Stopping container '{name}' using port {port}...")
-                        run_cmd_list(["docker", "stop", name])
-                        log(f"Container '{name}' stopped.")
-                        return name
-                    else:
-                        log("User chose not to stop the container. Installation aborted.")
-                        return "__CANCELLED__"
-            except ValueError:
-                continue
+    for match in _PS_PORTS_LINE_RE.finditer(ports_info):
+        name = match['name']
+        if any(int(p) == port for p in _HOST_PORT_RE.findall(match['ports'])):
+            # Ask the user before stopping
+            if ask_yes_no_on_ui("Port in use", f"Container '{name}' is using port {port}. Stop it?"):
+                log(f"Stopping container '{name}' using port {port}...")
+                docker_op(["docker", "stop", name], lambda api: api.stop(name))
+                log(f"Container '{name}' stopped.")
+                return name
+            else:
+                log("User chose not to stop the container. Installation aborted.")
+                return "__CANCELLED__"
     return None
 
 # ---------- Progress helpers ----------
 def start_progress(msg):
+    global progress_active
     progress_label.config(text=msg)
+    progress_active += 1
+    if progress_active > 1:
+        # Another operation (e.g. a concurrent pull) already shows the bar
+        return
     if setup_toggle_var.get():
         try:
             # Insert progress frame right after steps_frame for better visual flow
@@ -623,15 +926,75 @@ def start_progress(msg):
     progress_bar.start(10)
 
 def stop_progress():
+    global progress_active
+    progress_active = max(0, progress_active - 1)
+    if progress_active:
+        return
     progress_bar.stop()
     progress_frame.pack_forget()
 
+# Docker Desktop's daemon settings (the engine config shown under Settings > Docker Engine)
+DOCKER_DAEMON_CONFIG_PATH = os.path.join(os.path.expanduser("~"), ".docker", "daemon.json")
+MAX_CONCURRENT_DOWNLOADS = 24
+# The user said no this session; don't ask again on every install
+_concurrent_downloads_declined = False
+
+def ensure_concurrent_downloads(n=MAX_CONCURRENT_DOWNLOADS):
+    """Offer to raise the daemon's max-concurrent-downloads (default 3) so image layers are fetched in parallel"""
+    global _concurrent_downloads_declined
+    # Only an existing Docker Desktop config is touched; a system dockerd config needs admin rights
+    if _concurrent_downloads_declined or not os.path.isfile(DOCKER_DAEMON_CONFIG_PATH):
+        return
+    try:
+        with open(DOCKER_DAEMON_CONFIG_PATH, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        if not isinstance(config, dict) or config.get("max-concurrent-downloads", 3) >= n:
+            return
+        if not ask_yes_no_on_ui(
+            "Docker download settings",
+            f"Docker downloads at most {config.get('max-concurrent-downloads', 3)} image layers at a time.\n\n"
+            f"Set max-concurrent-downloads to {n} in {DOCKER_DAEMON_CONFIG_PATH} to speed up future pulls?\n"
+            "The file will be rewritten as formatted JSON, and the change only takes effect after Docker restarts.",
+        ):
+            _concurrent_downloads_declined = True
+            return
+        config["max-concurrent-downloads"] = n
+        mode = os.stat(DOCKER_DAEMON_CONFIG_PATH).st_mode & 0o7777
+        # Write a sibling temp file and swap it in, so Docker never sees a half-written config
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(DOCKER_DAEMON_CONFIG_PATH), suffix=UPDATE_TEMP_EXT)
+        try:
+            # Hand the fd to a file object first, so it is closed whatever fails afterwards
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(config, f, indent=2)
+            # mkstemp creates the file 0600; keep the original file's permissions
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, DOCKER_DAEMON_CONFIG_PATH)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        log(f"Set max-concurrent-downloads={n} in {DOCKER_DAEMON_CONFIG_PATH} (takes effect after Docker restarts).")
+    except (OSError, ValueError, TypeError) as e:
+        log(f"Could not update Docker daemon config: {e}")
+
+def image_exists_locally(image):
+    # Inspecting a single image is constant-time, unlike listing every local image
+    client = get_docker_client()
+    if client is not None:
+        try:
+            client.api.inspect_image(image)
+            return True
+        except docker_sdk.errors.NotFound:
+            return False
+        except Exception:
+            pass
+    result = _run(["docker", "image", "inspect", image], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return result.returncode == 0
+
 def check_and_pull_image(image):
-    images = run_cmd_list(["docker", "images", "--format", "{{.Repository}}:{{.Tag}}"]) or ""
-    if image not in images.splitlines():
+    if not image_exists_locally(image):
         log(f"Image '{image}' not found locally. Pulling...")
         run_on_ui(start_progress, f"Pulling {image} ...")
-        result = run_cmd_list(["docker", "pull", image], fatal=True)
+        result = run_cmd_list(["docker", "pull", image], fatal=True, capture=False)
         run_on_ui(stop_progress)
         if result is None:
             log(f"[FAIL] Failed to pull image {image}. Installation stopped.")
@@ -642,50 +1005,146 @@ def check_and_pull_image(image):
         log(f"Image '{image}' already available locally.")
     return True
 
+# Jira images prefetched (or being prefetched) this session
+_prefetched = set()
+# Only complete versions are prefetched: "10.2" is a different, floating tag
+_PREFETCH_VERSION_RE = re.compile(r"^\d+\.\d+\.\d+$")
+# The current background pull, so it can be cancelled: [image, Popen or None until started] or None
+_prefetch_job = None
+_prefetch_lock = threading.Lock()
+
+def cancel_prefetch(keep_image=None):
+    """Stop the background pull, unless it is already fetching keep_image"""
+    global _prefetch_job
+    with _prefetch_lock:
+        if _prefetch_job is None or _prefetch_job[0] == keep_image:
+            return
+        image, proc = _prefetch_job
+        _prefetch_job = None
+        _prefetched.discard(image)
+    if proc is not None:
+        # Stopping the CLI client aborts the daemon's pull (unless Install shares it)
+        proc.terminate()
+        log(f"Cancelled prefetch of {image}.")
+
+def prefetch_jira_image(version):
+    """Start pulling the Jira image for version in the background, so Install finds it already cached"""
+    if not prefetch_var.get():
+        return
+    if not _PREFETCH_VERSION_RE.match(version) or get_major_version(version) not in (8, 9, 10, 11):
+        return
+    image = f"atlassian/jira-software:{version}"
+    # Only one prefetch at a time: a newly confirmed version replaces the previous one
+    cancel_prefetch(keep_image=image)
+    global _prefetch_job
+    with _prefetch_lock:
+        if image in _prefetched:
+            return
+        _prefetched.add(image)
+        job = _prefetch_job = [image, None]
+
+    def task():
+        global _prefetch_job
+        local = image_exists_locally(image)
+        with _prefetch_lock:
+            if _prefetch_job is not job:
+                # Cancelled while checking
+                return
+            if local:
+                _prefetch_job = None
+                return
+            # A concurrent 'docker pull' of the same image (e.g. from Install) simply shares the download
+            job[1] = subprocess.Popen(["docker", "pull", image], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **_WIN_SUBPROCESS_KWARGS)
+        log(f"Prefetching {image} in the background...")
+        returncode = job[1].wait()
+        with _prefetch_lock:
+            if _prefetch_job is not job:
+                # Cancelled; cancel_prefetch already reset the state
+                return
+            _prefetch_job = None
+            if returncode != 0:
+                # Unknown tag or network trouble; allow another attempt later
+                _prefetched.discard(image)
+        if returncode == 0:
+            log(f"[OK] Prefetched {image}.")
+
+    threading.Thread(target=task, name="prefetch", daemon=True).start()
+
 # ---------- UI drain loop ----------
-def ui_drain():
+def flush_logs():
+    # Write all buffered log lines with a single Text insert (and at most one scroll)
+    global log_flush_pending
+    # Clear before taking the lines: anything logged from here on requests a fresh flush
+    log_flush_pending = False
+    lines = []
     try:
         while True:
-            item = ui_queue.get_nowait()
-            kind = item[0]
-            if kind == "log":
-                _, msg = item
-                try:
-                    log_text.insert(tk.END, msg + "\n")
-                    if auto_scroll_var.get():
-                        log_text.see(tk.END)
-                except Exception:
-                    pass
-            elif kind == "call":
-                _, func, args, kwargs = item
-                try:
-                    func(*args, **kwargs)
-                except Exception:
-                    pass
-            elif kind == "error":
-                _, title, message = item
-                try:
-                    messagebox.showerror(title, message)
-                except Exception:
-                    pass
-            elif kind == "askyesno":
-                _, title, message, result_container, done = item
-                try:
-                    result_container["result"] = messagebox.askyesno(title, message)
-                finally:
-                    done.set()
-            else:
-                # Unknown item; ignore
-                pass
-    except queue.Empty:
+            lines.append(log_queue.popleft())
+    except IndexError:
+        pass
+    if not lines:
+        return
+    try:
+        log_text.insert(tk.END, "\n".join(lines) + "\n")
+        if auto_scroll_var.get():
+            log_text.see(tk.END)
+    except Exception:
         pass
-    # Reschedule
-    root.after(100, ui_drain)
+
+def ui_drain(event=None):
+    global ui_wake_pending
+    # Clear the flag first: anything posted from here on generates a fresh wake-up event
+    ui_wake_pending = False
+    # Take everything queued so far; items posted while we run are handled by the next event
+    items = []
+    try:
+        while True:
+            items.append(ui_queue.popleft())
+    except IndexError:
+        pass
+    # Only the latest call to a progress updater matters; earlier ones are skipped
+    last_call_index = {}
+    for i, item in enumerate(items):
+        if item[0] == "call" and item[1] in _COALESCE_FUNCS:
+            last_call_index[item[1]] = i
+    for i, item in enumerate(items):
+        kind = item[0]
+        if kind == "call" and last_call_index.get(item[1], i) != i:
+            continue
+        if kind in ("error", "askyesno"):
+            # Show the log lines leading up to a dialog before it blocks
+            flush_logs()
+        if kind == "call":
+            _, func, args, kwargs = item
+            try:
+                func(*args, **kwargs)
+            except Exception:
+                pass
+        elif kind == "error":
+            _, title, message = item
+            try:
+                messagebox.showerror(title, message)
+            except Exception:
+                pass
+        elif kind == "askyesno":
+            _, title, message, result_container, done = item
+            try:
+                result_container["result"] = messagebox.askyesno(title, message)
+            finally:
+                done.set()
+        elif kind == "flush_logs":
+            # Let lines accumulate for one interval, then write them with a single insert
+            root.after(LOG_FLUSH_INTERVAL_MS, flush_logs)
+        else:
+            # Unknown item; ignore
+            pass
 
 # ---------- Visual multi-step progress helpers ----------
 def init_steps_panel(steps):
-    global current_steps, step_labels, overall_steps_total, overall_steps_done, install_start_time, current_step_start_time, current_step_index
+    global current_steps, step_labels, steps_state, rendered_steps, overall_steps_total, overall_steps_done, install_start_time, current_step_index
     current_steps = steps
+    steps_state = [("pending", "")] * len(steps)
+    rendered_steps = [None] * len(steps)
     # Clear existing step labels
     for w in steps_frame.winfo_children():
         w.destroy()
@@ -697,50 +1156,81 @@ def init_steps_panel(steps):
     overall_steps_total = len(steps)
     overall_steps_done = 0
     install_start_time = time.time()
-    current_step_start_time = None
+    step_start_times.clear()
     current_step_index = None
     update_overall_progress()
-    start_elapsed_updates()
+    start_elapsed_timer()
+
+# Label prefix and colour per step status (pending labels keep the look they were created with)
+STEP_STYLES = {
+    "running": ("[RUNNING]", "black"),
+    "done": ("[DONE]", "green"),
+    "error": ("[ERROR]", "red"),
+}
+
+def schedule_steps_redraw():
+    # Coalesce any number of step transitions into one label pass
+    global steps_redraw_pending
+    if not steps_redraw_pending:
+        steps_redraw_pending = True
+        root.after_idle(redraw_steps)
+
+def redraw_steps():
+    global steps_redraw_pending
+    steps_redraw_pending = False
+    bg = root.cget('bg')
+    for index, (status, suffix) in enumerate(steps_state):
+        if status == "pending":
+            continue
+        prefix, fg = STEP_STYLES[status]
+        # Only the current running step is highlighted
+        highlighted = status == "running" and index == current_step_index
+        look = (
+            f"{prefix} {current_steps[index]}{suffix}",
+            fg,
+            (None, 9, 'bold' if highlighted else 'normal'),
+            "#fffbe6" if highlighted else bg,
+        )
+        if rendered_steps[index] != look:
+            text, fg, font, label_bg = look
+            step_labels[index].config(text=text, fg=fg, font=font, bg=label_bg)
+            rendered_steps[index] = look
 
 def set_step_running(index):
     global current_step_index
     if 0 <= index < len(step_labels):
-        # Reset previous current step styling
-        if current_step_index is not None and 0 <= current_step_index < len(step_labels):
-            try:
-                step_labels[current_step_index].config(bg=root.cget('bg'), font=(None, 9, 'normal'))
-            except Exception:
-                pass
-        title = current_steps[index]
-        step_labels[index].config(text=f"[RUNNING] {title}", fg="black", font=(None, 9, 'bold'), bg="#fffbe6")
+        steps_state[index] = ("running", "")
         current_step_index = index
-        start_step_timer()
+        start_step_timer(index)
+        schedule_steps_redraw()
 
 def set_step_done(index):
     if 0 <= index < len(step_labels):
-        title = current_steps[index]
-        duration_txt = format_duration(get_and_clear_step_duration())
+        duration_txt = format_duration(get_and_clear_step_duration(index))
         suffix = f" ({duration_txt})" if duration_txt else ""
-        step_labels[index].config(text=f"[DONE] {title}{suffix}", fg="green", font=(None, 9, 'normal'), bg=root.cget('bg'))
+        steps_state[index] = ("done", suffix)
+        schedule_steps_redraw()
         increment_overall_progress()
 
+def advance_step(done_index, next_index):
+    # One UI update for the usual "finish this step, start the next one" transition
+    set_step_done(done_index)
+    set_step_running(next_index)
+
 def set_step_error(index):
     if 0 <= index < len(step_labels):
-        title = current_steps[index]
-        step_labels[index].config(text=f"[ERROR] {title}", fg="red", font=(None, 9, 'normal'), bg=root.cget('bg'))
+        steps_state[index] = ("error", "")
+        schedule_steps_redraw()
         update_overall_progress()
 
-def start_step_timer():
-    global current_step_start_time
-    current_step_start_time = time.time()
+def start_step_timer(index):
+    step_start_times[index] = time.time()
 
-def get_and_clear_step_duration():
-    global current_step_start_time
-    if current_step_start_time is None:
+def get_and_clear_step_duration(index):
+    start_time = step_start_times.pop(index, None)
+    if start_time is None:
         return 0
-    elapsed = max(0, int(time.time() - current_step_start_time))
-    current_step_start_time = None
-    return elapsed
+    return max(0, int(time.time() - start_time))
 
 def format_duration(seconds: int) -> str:
     try:
@@ -755,39 +1245,40 @@ def format_duration(seconds: int) -> str:
         return f"{m}m {s}s"
     return f"{s}s"
 
-def start_elapsed_updates():
-    global elapsed_job_id
-    if elapsed_job_id is None:
-        elapsed_job_id = root.after(1000, update_elapsed_labels)
+def start_elapsed_timer():
+    global elapsed_timer_running
+    if not elapsed_timer_running:
+        elapsed_timer_running = True
+        root.after(ELAPSED_UPDATE_MS, elapsed_timer_tick)
 
-def stop_elapsed_updates():
-    global elapsed_job_id
-    if elapsed_job_id is not None:
-        try:
-            root.after_cancel(elapsed_job_id)
-        except Exception:
-            pass
-        elapsed_job_id = None
+def elapsed_timer_tick():
+    # Runs once a second while an install is being timed, then stops until the next install
+    global elapsed_timer_running
+    try:
+        update_elapsed_labels()
+    except Exception:
+        pass
+    if install_start_time is not None:
+        root.after(ELAPSED_UPDATE_MS, elapsed_timer_tick)
+    else:
+        elapsed_timer_running = False
 
 def update_elapsed_labels():
-    global elapsed_job_id
-    try:
-        if install_start_time is not None:
-            total_elapsed = int(time.time() - install_start_time)
-            total_elapsed_label.config(text=f"Total time: {format_duration(total_elapsed)}")
-            if current_step_start_time is not None:
-                step_elapsed = int(time.time() - current_step_start_time)
-                current_step_elapsed_label.config(text=f"Current step: {format_duration(step_elapsed)}")
-            else:
-                current_step_elapsed_label.config(text="Current step: -")
-    finally:
-        elapsed_job_id = root.after(1000, update_elapsed_labels)
+    # Labels keep their last values once timing has finished
+    if install_start_time is not None:
+        total_elapsed = int(time.time() - install_start_time)
+        total_elapsed_label.config(text=f"Total time: {format_duration(total_elapsed)}")
+        current_step_start_time = step_start_times.get(current_step_index)
+        if current_step_start_time is not None:
+            step_elapsed = int(time.time() - current_step_start_time)
+            current_step_elapsed_label.config(text=f"Current step: {format_duration(step_elapsed)}")
+        else:
+            current_step_elapsed_label.config(text="Current step: -")
 
 def finish_steps_timing():
-    global install_start_time, current_step_start_time
+    global install_start_time
     install_start_time = None
-    current_step_start_time = None
-    stop_elapsed_updates()
+    step_start_times.clear()
 
 def increment_overall_progress():
     global overall_steps_done
@@ -800,12 +1291,306 @@ def update_overall_progress():
     overall_progress_bar["value"] = percent
     overall_progress_label.config(text=f"Overall progress: {percent}%")
 
+# Idempotent UI updaters posted from workers: when several calls are queued, ui_drain only runs the latest one
+_COALESCE_FUNCS = {update_download_progress}
+
+# ---------- Installation steps ----------
+# Visual steps for each installation variant (indices are used directly by the tasks below).
+# Each step ends with advance_step(i, i + 1), which also starts the next step.
+INSTALL_STEPS_BUILTIN_DB = (
+    "Create/check network",
+    "Pull Jira image",
+    "Start Jira",
+    "Patch JVM args",
+    "Restart Jira",
+    "Finalize",
+)
+INSTALL_STEPS_MYSQL = (
+    "Create/check network",
+    "Pull Jira image",
+    "Pull MySQL image",
+    "Start MySQL",
+    "Download/extract JDBC",
+    "Start Jira",
+    "Patch JVM args",
+    "Restart Jira",
+    "Finalize",
+)
+
+def _fail_step(step_index):
+    run_on_ui(set_step_error, step_index)
+    run_on_ui(finish_steps_timing)
+
+def _begin_install(steps, version, port, resources):
+    """Initialize the steps panel and query Docker; returns the docker probe, or None if Docker is unavailable"""
+    log(f"Starting installation of Jira {version} on port {port}...")
+    run_on_ui(init_steps_panel, steps)
+    run_on_ui(set_step_running, 0)
+
+    # Query Docker once, concurrently, for everything the checks below need
+    probe = _parallel_docker_probe(resources)
+    if not (probe["installed"] and probe["running"]):
+        log("[FAIL] Docker is not available or not running. Installation stopped.")
+        _fail_step(0)
+        return None
+    ensure_concurrent_downloads()
+    return probe
+
+def _ensure_network_step(network_name, networks):
+    """Step 0: create the docker network if needed"""
+    if not ensure_network(network_name, network_name in networks):
+        _fail_step(0)
+        return False
+    run_on_ui(advance_step, 0, 1)
+    return True
+
+def _pull_images_step(version, jira_container_name, containers, mysql_image=None):
+    """Step 1 (and 2 with MySQL): remove a conflicting Jira container and make sure the images are available; returns the Jira image or None"""
+    if check_container_exists(jira_container_name, containers):
+        log(f"Container '{jira_container_name}' already exists.")
+        if ask_yes_no_on_ui("Container exists", f"Container {jira_container_name} exists. Remove it and continue?"):
+            docker_op(["docker", "rm", "-f", jira_container_name], lambda api: api.remove_container(jira_container_name, force=True))
+            # Keep the pre-checked names in step with what we just changed
+            containers.discard(jira_container_name)
+            log(f"Removed existing container {jira_container_name}.")
+        else:
+            log("Installation cancelled by user.")
+            _fail_step(1)
+            return None
+
+    jira_image = f"atlassian/jira-software:{version}"
+    # Step index -> image; the pulls don't depend on each other, so they run concurrently
+    images = {1: jira_image}
+    if mysql_image:
+        images[2] = mysql_image
+        run_on_ui(set_step_running, 2)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(images)) as executor:
+        pulls = {step: executor.submit(check_and_pull_image, image) for step, image in images.items()}
+    results = {step: future.result() for step, future in pulls.items()}
+    if not all(results.values()):
+        for step, pulled in results.items():
+            run_on_ui(set_step_done if pulled else set_step_error, step)
+        return None
+    *earlier_steps, last_step = results
+    for step in earlier_steps:
+        run_on_ui(set_step_done, step)
+    run_on_ui(advance_step, last_step, last_step + 1)
+    return jira_image
+
+# Jira's setenv.sh either defaults the variable (": ${JVM_SUPPORT_RECOMMENDED_ARGS:=""}") or assigns it
+JIRA_SETENV_PATH = "/opt/atlassian/jira/bin/setenv.sh"
+_JVM_ARGS_LINE_RE = re.compile(r'^(?::[ \t]*\$\{JVM_SUPPORT_RECOMMENDED_ARGS[^}]*\}|JVM_SUPPORT_RECOMMENDED_ARGS=[^\r\n]*)', re.M)
+
+def patch_jvm_args(container_name, jvm_args):
+    """Set JVM_SUPPORT_RECOMMENDED_ARGS in the container's setenv.sh; returns False on failure"""
+    # Copy the file out, substitute in Python and copy it back: no shell or sed quoting inside the container
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        local_path = os.path.join(tmp_dir, "setenv.sh")
+        if run_cmd_list(["docker", "cp", f"{container_name}:{JIRA_SETENV_PATH}", local_path], fatal=True, capture=False) is None:
+            return False
+        # Rewrite in place so the file keeps the mode docker cp gave it (Jira's user must still be able to read it)
+        with open(local_path, 'r+', encoding='utf-8', newline='') as f:
+            content = _JVM_ARGS_LINE_RE.sub(lambda m: f'JVM_SUPPORT_RECOMMENDED_ARGS="{jvm_args}"', f.read())
+            f.seek(0)
+            f.write(content)
+            f.truncate()
+        return run_cmd_list(["docker", "cp", local_path, f"{container_name}:{JIRA_SETENV_PATH}"], fatal=True, capture=False) is not None
+
+def _patch_and_restart_jira_steps(version, jira_container_name, step_index):
+    """Patch JVM args (at step_index) and restart Jira (at step_index + 1)"""
+    # Patch JVM args safely (version-specific for Jira 11)
+    # Determine JVM arguments based on Jira version
+    if get_major_version(version) == 11:
+        # Jira 11: include both existing and new JVM arguments
+        jvm_args = "-Dupm.plugin.upload.enabled=true -Datlassian.upm.signature.check.disabled=true"
+    else:
+        # Jira 10 and earlier: use existing JVM argument only
+        jvm_args = "-Dupm.plugin.upload.enabled=true"
+
+    if not patch_jvm_args(jira_container_name, jvm_args):
+        _fail_step(step_index)
+        return False
+    run_on_ui(advance_step, step_index, step_index + 1)
+
+    # Restart Jira
+    step_index += 1
+    if docker_op(["docker", "restart", jira_container_name], lambda api: api.restart(jira_container_name), fatal=True) is None:
+        _fail_step(step_index)
+        return False
+    run_on_ui(advance_step, step_index, step_index + 1)
+    return True
+
+def _finalize_step(step_index, version, port, details=()):
+    """Final step: log the connection details"""
+    log(f"[OK] Jira {version} installation complete!")
+    for line in details:
+        log(line)
+    log(f"[INFO] Jira URL: http://localhost:{port}")
+    log(f"[INFO] Jira Login: admin/admin")
+    log("")
+    run_on_ui(set_step_done, step_index)
+    run_on_ui(finish_steps_timing)
+
+def _install_no_mysql(version, port, jira_container_name, network_name):
+    """Install Jira 8.x/9.x with its built-in database"""
+    probe = _begin_install(INSTALL_STEPS_BUILTIN_DB, version, port, {
+        "containers": [jira_container_name],
+        "networks": [network_name],
+    })
+    if probe is None or not _ensure_network_step(network_name, probe["networks"]):
+        return
+
+    jira_image = _pull_images_step(version, jira_container_name, probe["containers"])
+    if jira_image is None:
+        return
+
+    # Start Jira
+    log(f"Installing Jira {version}...")
+    if run_cmd_list([
+        "docker", "run", "-d",
+        "--pull=missing",
+        "--name", jira_container_name,
+        "--network", network_name,
+        "-p", f"{port}:8080",
+        jira_image
+    ], fatal=True, capture=False) is None:
+        _fail_step(2)
+        return
+    run_on_ui(advance_step, 2, 3)
+
+    if not _patch_and_restart_jira_steps(version, jira_container_name, 3):
+        return
+
+    _finalize_step(5, version, port)
+
+def _install_mysql(version, port, jira_container_name, network_name, jdbc_version,
+                   mysql_container_name, mysql_db_name, mysql_volume_name, mysql_hostname,
+                   mysql_root_password, mysql_user, mysql_password, mysql_image, mysql_port):
+    """Install Jira 10.x/11.x backed by a MySQL container"""
+    jdbc_tar = f"mysql-connector-j-{jdbc_version}.tar.gz"
+    jdbc_url = f"https://dev.mysql.com/get/Downloads/Connector-J/{jdbc_tar}"
+    jdbc_folder = f"mysql-connector-j-{jdbc_version}"
+
+    probe = _begin_install(INSTALL_STEPS_MYSQL, version, port, {
+        "containers": [jira_container_name, mysql_container_name],
+        "volumes": [mysql_volume_name],
+        "networks": [network_name],
+    })
+    if probe is None or not _ensure_network_step(network_name, probe["networks"]):
+        return
+
+    jira_image = _pull_images_step(version, jira_container_name, probe["containers"], mysql_image)
+    if jira_image is None:
+        return
+
+    # Start MySQL
+
+    # Check and delete existing volume before creating container
+    if check_volume_exists(mysql_volume_name, probe["volumes"]):
+        log(f"Volume '{mysql_volume_name}' already exists. Deleting it...")
+        if not delete_volume(mysql_volume_name):
+            log(f"[FAIL] Failed to delete existing volume '{mysql_volume_name}'. Installation stopped.")
+            _fail_step(3)
+            return
+        probe["volumes"].discard(mysql_volume_name)
+        log(f"[OK] Existing volume '{mysql_volume_name}' deleted successfully.")
+
+    log(f"Installing MySQL container '{mysql_container_name}' with custom credentials...")
+    if not check_container_exists(mysql_container_name, probe["containers"]):
+        if run_cmd_list([
+            "docker", "run", "-d",
+            "--pull=missing",
+            "--name", mysql_container_name,
+            "--network", network_name,
+            "-e", f"MYSQL_ROOT_PASSWORD={mysql_root_password}",
+            "-e", f"MYSQL_DATABASE={mysql_db_name}",
+            "-e", f"MYSQL_USER={mysql_user}",
+            "-e", f"MYSQL_PASSWORD={mysql_password}",
+            "-v", f"{mysql_volume_name}:/var/lib/mysql",
+            mysql_image
+        ], fatal=True, capture=False) is None:
+            _fail_step(3)
+            return
+        log("MySQL container started.")
+    else:
+        log("MySQL container already running.")
+    run_on_ui(advance_step, 3, 4)
+
+    # JDBC download/extract
+    # Only fetch the connector when no extracted jar is present
+    jar_file = find_jdbc_jar(jdbc_folder)
+    if not jar_file:
+        try:
+            shutil.rmtree(jdbc_folder, ignore_errors=True)
+            # Decompress and extract while downloading; the archive is never written to disk
+            log(f"Downloading MySQL JDBC Connector {jdbc_version}...")
+            with urllib.request.urlopen(jdbc_url) as response, tarfile.open(fileobj=response, mode="r|gz") as tar:
+                safe_extract_tar(tar, ".")
+        except Exception as e:
+            # Don't leave a half-extracted folder behind
+            shutil.rmtree(jdbc_folder, ignore_errors=True)
+            show_error_ui("Download/Extract Error", f"Failed to obtain JDBC driver: {e}")
+            _fail_step(4)
+            return
+        jar_file = find_jdbc_jar(jdbc_folder)
+    if not jar_file:
+        show_error_ui("Error", "JDBC jar not found.")
+        _fail_step(4)
+        return
+    run_on_ui(advance_step, 4, 5)
+
+    # Start Jira (after MySQL readiness)
+    log("Waiting for MySQL to become ready...")
+    if not wait_for_mysql_ready(mysql_container_name, root_password=mysql_root_password, timeout_seconds=120):
+        log("MySQL did not become ready in time.")
+        _fail_step(5)
+        return
+    log("MySQL is ready. Proceeding to start Jira...")
+    log(f"Installing Jira {version}...")
+    if run_cmd_list([
+        "docker", "run", "-d",
+        "--pull=missing",
+        "--name", jira_container_name,
+        "--network", network_name,
+        "-p", f"{port}:8080",
+        "-e", f'ATL_JDBC_URL=jdbc:mysql://{mysql_hostname}:{mysql_port}/{mysql_db_name}?useSSL=false&serverTimezone=UTC',
+        "-e", f"ATL_JDBC_USER={mysql_user}",
+        "-e", f"ATL_JDBC_PASSWORD={mysql_password}",
+        "-v", f"{to_docker_host_path(jar_file)}:/opt/atlassian/jira/lib/{os.path.basename(jar_file)}",
+        jira_image
+    ], fatal=True, capture=False) is None:
+        _fail_step(5)
+        return
+    run_on_ui(advance_step, 5, 6)
+
+    if not _patch_and_restart_jira_steps(version, jira_container_name, 6):
+        return
+
+    _finalize_step(8, version, port, details=(
+        f"[INFO] MySQL Host: {mysql_container_name}",
+        f"[INFO] DB: {mysql_db_name}",
+        f"[INFO] MySQL User: {mysql_user}",
+        f"[INFO] MySQL Password: {mysql_password}",
+    ))
+
 # ---------- Main functions ----------
+def get_major_version(version):
+    # None for input that doesn't start with "<digits>."
+    match = VERSION_RE.match(version)
+    return int(match.group(1)) if match else None
+
 def install_jira():
+    # Refuse a second install (or an install during an update check) instead of running them concurrently
+    if is_busy():
+        messagebox.showinfo("Busy", "Another task is still running. Please wait for it to finish.")
+        return
     version = version_entry.get().strip()
     if not version:
         messagebox.showerror("Error", "Please enter a Jira version (e.g., 9.15.0, 10.0.0, 11.0.0).")
         return
+    major = get_major_version(version)
+    # A prefetch of another version (e.g. changed but never confirmed) would compete with Install's pulls
+    cancel_prefetch(keep_image=f"atlassian/jira-software:{version}")
 
     # Get advanced configuration values with fallbacks
     if advanced_toggle_var.get():
@@ -813,9 +1598,9 @@ def install_jira():
         custom_port = port_entry.get().strip()
         if custom_port and custom_port.isdigit():
             port = int(custom_port)
-        elif version.startswith("8.") or version.startswith("9."):
+        elif major in (8, 9):
             port = 8081
-        elif version.startswith("10.") or version.startswith("11."):
+        elif major in (10, 11):
             port = 8080
         else:
             messagebox.showerror("Error", "Unsupported Jira version. Only 8.x, 9.x, 10.x, and 11.x are supported.")
@@ -826,7 +1611,7 @@ def install_jira():
         network_name = network_entry.get().strip() or "jira_network"
 
         # MySQL configuration (for Jira 10+)
-        if version.startswith("10.") or version.startswith("11."):
+        if major in (10, 11):
             is_mysql = True
             mysql_container_name = mysql_container_entry.get().strip() or f"{version}_mysql"
             mysql_db_name = db_name_entry.get().strip() or f"{version}_db"
@@ -846,10 +1631,10 @@ def install_jira():
         jdbc_version = jdbc_version_entry.get().strip() or JDBC_VERSION
     else:
         # Use standard defaults when advanced mode is disabled
-        if version.startswith("8.") or version.startswith("9."):
+        if major in (8, 9):
             port = 8081
             is_mysql = False
-        elif version.startswith("10.") or version.startswith("11."):
+        elif major in (10, 11):
             port = 8080
             is_mysql = True
         else:
@@ -872,16 +1657,10 @@ def install_jira():
 
         jdbc_version = JDBC_VERSION
 
-    # Update JDBC constants to use custom version
-    jdbc_tar = f"mysql-connector-j-{jdbc_version}.tar.gz"
-    jdbc_url = f"https://dev.mysql.com/get/Downloads/Connector-J/{jdbc_tar}"
-    jdbc_folder = f"mysql-connector-j-{jdbc_version}"
-
     stopped_container = stop_container_using_port(port)
     if stopped_container == "__CANCELLED__":
         # Initialize and immediately mark canceled to reflect in UI
-        steps = ["Create/check network", "Pull Jira image", "Start Jira" if not is_mysql else "Pull MySQL image"]
-        run_on_ui(init_steps_panel, steps)
+        run_on_ui(init_steps_panel, INSTALL_STEPS_MYSQL if is_mysql else INSTALL_STEPS_BUILTIN_DB)
         run_on_ui(set_step_error, 0)
         log("Installation cancelled by user.")
         run_on_ui(finish_steps_timing)
@@ -889,225 +1668,37 @@ def install_jira():
     if stopped_container:
         log(f"Port {port} was freed by stopping '{stopped_container}'.")
 
-    def task():
-        log(f"Starting installation of Jira {version} on port {port}...")
-        # Initialize visual steps for progress
-        steps = [
-            "Create/check network",
-            "Pull Jira image",
-        ]
-        if is_mysql:
-            steps.extend(["Pull MySQL image", "Start MySQL", "Download/extract JDBC", "Start Jira", "Patch JVM args", "Restart Jira", "Finalize"])
-        else:
-            steps.extend(["Start Jira", "Patch JVM args", "Restart Jira", "Finalize"])
-        run_on_ui(init_steps_panel, steps)
-        step_index = 0
-        run_on_ui(set_step_running, step_index)
-
-        # Ensure network
-        networks = run_cmd_list(["docker", "network", "ls", "--format", "{{.Name}}"]) or ""
-        if network_name not in networks.splitlines():
-            log(f"Creating docker network '{network_name}'...")
-            if run_cmd_list(["docker", "network", "create", network_name], fatal=True) is None:
-                run_on_ui(set_step_error, step_index)
-                run_on_ui(finish_steps_timing)
-                return
-        else:
-            log(f"'{network_name}' already exists.")
-        run_on_ui(set_step_done, step_index)
-
-        # Step: Pull Jira image
-        step_index += 1
-        run_on_ui(set_step_running, step_index)
-
-        if check_container_exists(jira_container_name):
-            log(f"Container '{jira_container_name}' already exists.")
-            if ask_yes_no_on_ui("Container exists", f"Container {jira_container_name} exists. Remove it and continue?"):
-                run_cmd_list(["docker", "rm", "-f", jira_container_name])
-                log(f"Removed existing container {jira_container_name}.")
-            else:
-                log("Installation cancelled by user.")
-                run_on_ui(set_step_error, step_index)
-                run_on_ui(finish_steps_timing)
-                return
-
-        jira_image = f"atlassian/jira-software:{version}"
-        if not check_and_pull_image(jira_image):
-            run_on_ui(set_step_error, step_index)
-            return
-        run_on_ui(set_step_done, step_index)
-
-        if not is_mysql:
-            # Jira 8/9 with built-in DB
-            step_index += 1
-            run_on_ui(set_step_running, step_index)
-            log(f"Installing Jira {version}...")
-            if run_cmd_list([
-                "docker", "run", "-d",
-                "--name", jira_container_name,
-                "--network", network_name,
-                "-p", f"{port}:8080",
-                jira_image
-            ], fatal=True) is None:
-                run_on_ui(set_step_error, step_index)
-                run_on_ui(finish_steps_timing)
-                return
-            run_on_ui(set_step_done, step_index)
-        else:
-            # Jira 10+ with MySQL
-            # Pull MySQL image
-            step_index += 1
-            run_on_ui(set_step_running, step_index)
-
-            mysql_image = mysql_version
-            if not check_and_pull_image(mysql_image):
-                run_on_ui(set_step_error, step_index)
-                return
-            run_on_ui(set_step_done, step_index)
-
-            # Start MySQL
-            step_index += 1
-            run_on_ui(set_step_running, step_index)
-
-            # Check and delete existing volume before creating container
-            if check_volume_exists(mysql_volume_name):
-                log(f"Volume '{mysql_volume_name}' already exists. Deleting it...")
-                if not delete_volume(mysql_volume_name):
-                    log(f"[FAIL] Failed to delete existing volume '{mysql_volume_name}'. Installation stopped.")
-                    run_on_ui(set_step_error, step_index)
-                    run_on_ui(finish_steps_timing)
-                    return
-                log(f"[OK] Existing volume '{mysql_volume_name}' deleted successfully.")
-
-            log(f"Installing MySQL container '{mysql_container_name}' with custom credentials...")
-            if not check_container_exists(mysql_container_name):
-                if run_cmd_list([
-                    "docker", "run", "-d",
-                    "--name", mysql_container_name,
-                    "--network", network_name,
-                    "-e", f"MYSQL_ROOT_PASSWORD={mysql_root_password}",
-                    "-e", f"MYSQL_DATABASE={mysql_db_name}",
-                    "-e", f"MYSQL_USER={mysql_user}",
-                    "-e", f"MYSQL_PASSWORD={mysql_password}",
-                    "-v", f"{mysql_volume_name}:/var/lib/mysql",
-                    mysql_image
-                ], fatal=True) is None:
-                    run_on_ui(set_step_error, step_index)
-                    run_on_ui(finish_steps_timing)
-                    return
-                log("MySQL container started.")
-            else:
-                log("MySQL container already running.")
-            run_on_ui(set_step_done, step_index)
-
-            # JDBC download/extract
-            step_index += 1
-            run_on_ui(set_step_running, step_index)
-            try:
-                if not os.path.exists(jdbc_tar):
-                    log(f"Downloading MySQL JDBC Connector {jdbc_version}...")
-                    urllib.request.urlretrieve(jdbc_url, jdbc_tar)
-                if not os.path.exists(jdbc_folder):
-                    with tarfile.open(jdbc_tar) as tar:
-                        safe_extract_tar(tar, ".")
-            except Exception as e:
-                show_error_ui("Download/Extract Error", f"Failed to obtain JDBC driver: {e}")
-                run_on_ui(set_step_error, step_index)
-                run_on_ui(finish_steps_timing)
-                return
-            jar_file = None
-            for root, dirs, files in os.walk(jdbc_folder):
-                for file in files:
-                    if file.endswith(".jar"):
-                        jar_file = os.path.join(root, file)
-                        break
-            if not jar_file:
-                show_error_ui("Error", "JDBC jar not found.")
-                run_on_ui(set_step_error, step_index)
-                run_on_ui(finish_steps_timing)
-                return
-            run_on_ui(set_step_done, step_index)
-
-            # Start Jira (after MySQL readiness)
-            step_index += 1
-            run_on_ui(set_step_running, step_index)
-            log("Waiting for MySQL to become ready...")
-            if not wait_for_mysql_ready(mysql_container_name, root_password=mysql_root_password, timeout_seconds=120):
-                log("MySQL did not become ready in time.")
-                run_on_ui(set_step_error, step_index)
-                run_on_ui(finish_steps_timing)
-                return
-            log("MySQL is ready. Proceeding to start Jira...")
-            log(f"Installing Jira {version}...")
-            if run_cmd_list([
-                "docker", "run", "-d",
-                "--name", jira_container_name,
-                "--network", network_name,
-                "-p", f"{port}:8080",
-                "-e", f'ATL_JDBC_URL=jdbc:mysql://{mysql_hostname}:{mysql_port}/{mysql_db_name}?useSSL=false&serverTimezone=UTC',
-                "-e", f"ATL_JDBC_USER={mysql_user}",
-                "-e", f"ATL_JDBC_PASSWORD={mysql_password}",
-                "-v", f"{to_docker_host_path(jar_file)}:/opt/atlassian/jira/lib/{os.path.basename(jar_file)}",
-                jira_image
-            ], fatal=True) is None:
-                run_on_ui(set_step_error, step_index)
-                run_on_ui(finish_steps_timing)
-                return
-            run_on_ui(set_step_done, step_index)
-
-        # Patch JVM args safely (version-specific for Jira 11)
-        step_index += 1
-        run_on_ui(set_step_running, step_index)
-
-        # Determine JVM arguments based on Jira version
-        if version.startswith("11."):
-            # Jira 11: include both existing and new JVM arguments
-            jvm_args = "-Dupm.plugin.upload.enabled=true -Datlassian.upm.signature.check.disabled=true"
-        else:
-            # Jira 10 and earlier: use existing JVM argument only
-            jvm_args = "-Dupm.plugin.upload.enabled=true"
-
-        sed_cmd = r'sed -i ' \
-                  r'"s#^\(:\s*\${JVM_SUPPORT_RECOMMENDED_ARGS[^}]*}\|JVM_SUPPORT_RECOMMENDED_ARGS=.*\)#JVM_SUPPORT_RECOMMENDED_ARGS=\"' + jvm_args + r'\"#"' \
-                  r' /opt/atlassian/jira/bin/setenv.sh'
-        if run_cmd_list(["docker", "exec", jira_container_name, "bash", "-c", sed_cmd], fatal=True) is None:
-            run_on_ui(set_step_error, step_index)
-            run_on_ui(finish_steps_timing)
-            return
-        run_on_ui(set_step_done, step_index)
-
-        # Restart Jira
-        step_index += 1
-        run_on_ui(set_step_running, step_index)
-        if run_cmd_list(["docker", "restart", jira_container_name], fatal=True) is None:
-            run_on_ui(set_step_error, step_index)
-            run_on_ui(finish_steps_timing)
-            return
-        run_on_ui(set_step_done, step_index)
-
-        # Final logs
-        step_index += 1
-        run_on_ui(set_step_running, step_index)
-        log(f"[OK] Jira {version} installation complete!")
-        if is_mysql:
-            log(f"[INFO] MySQL Host: {mysql_container_name}")
-            log(f"[INFO] DB: {mysql_db_name}")
-            log(f"[INFO] MySQL User: {mysql_user}")
-            log(f"[INFO] MySQL Password: {mysql_password}")
-        log(f"[INFO] Jira URL: http://localhost:{port}")
-        log(f"[INFO] Jira Login: admin/admin")
-        log("")
-        run_on_ui(set_step_done, step_index)
-        run_on_ui(finish_steps_timing)
-
-    threading.Thread(target=task).start()
+    # Pick the installation variant once; each runs its steps in a straight line
+    if is_mysql:
+        submit_task(
+            _install_mysql,
+            version=version,
+            port=port,
+            jira_container_name=jira_container_name,
+            network_name=network_name,
+            jdbc_version=jdbc_version,
+            mysql_container_name=mysql_container_name,
+            mysql_db_name=mysql_db_name,
+            mysql_volume_name=mysql_volume_name,
+            mysql_hostname=mysql_hostname,
+            mysql_root_password=mysql_root_password,
+            mysql_user=mysql_user,
+            mysql_password=mysql_password,
+            mysql_image=mysql_version,
+            mysql_port=mysql_port,
+        )
+    else:
+        submit_task(_install_no_mysql, version, port, jira_container_name, network_name)
 
 def view_docker_status():
     def task():
         log("=== Docker Status ===")
-        containers = run_cmd_list(["docker", "ps", "--format", "{{.Names}}\t{{.Image}}\t{{.Status}}\t{{.Ports}}"]) or ""
-        networks = run_cmd_list(["docker", "network", "ls", "--format", "{{.Name}}\t{{.Driver}}"]) or ""
-        volumes = run_cmd_list(["docker", "volume", "ls", "--format", "{{.Name}}\t{{.Driver}}"]) or ""
+        # The three queries are independent: run them concurrently, then log in a fixed order
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            containers = executor.submit(run_cmd_list, ["docker", "ps", "--format", "{{.Names}}\t{{.Image}}\t{{.Status}}\t{{.Ports}}"])
+            networks = executor.submit(run_cmd_list, ["docker", "network", "ls", "--format", "{{.Name}}\t{{.Driver}}"])
+            volumes = executor.submit(run_cmd_list, ["docker", "volume", "ls", "--format", "{{.Name}}\t{{.Driver}}"])
+            containers, networks, volumes = (f.result() or "" for f in (containers, networks, volumes))
 
         if containers:
             log("\n-- Running Containers --")
@@ -1130,7 +1721,8 @@ def view_docker_status():
 def set_advanced_defaults():
     """Set default values for advanced configuration fields based on Jira version"""
     version = version_entry.get().strip()
-    if version.startswith("8.") or version.startswith("9."):
+    major = get_major_version(version)
+    if major in (8, 9):
         port_entry.delete(0, tk.END)
         port_entry.insert(0, "8081")
         mysql_container_entry.delete(0, tk.END)
@@ -1141,7 +1733,7 @@ def set_advanced_defaults():
         mysql_volume_entry.insert(0, "")
         mysql_hostname_entry.delete(0, tk.END)
         mysql_hostname_entry.insert(0, "")
-    elif version.startswith("10.") or version.startswith("11."):
+    elif major in (10, 11):
         port_entry.delete(0, tk.END)
         port_entry.insert(0, "8080")
         mysql_container_entry.delete(0, tk.END)
@@ -1190,13 +1782,19 @@ def mouse_wheel(event):
 
 main_canvas.bind_all("<MouseWheel>", mouse_wheel)
 
+last_content_size = None  # Requested (width, height) of main_frame the window was last fitted to
+
 def resize_window_to_content():
     """Resize window to fit content when possible, otherwise keep scrollable"""
-    root.update_idletasks()  # Ensure all widgets are properly sized
-
-    # Get content height
+    global last_content_size
+    # Scheduled with after_idle, so pending geometry work has already run (no update_idletasks needed).
+    # Every <Configure> of main_frame lands here; only resize when the requested size actually changed,
+    # which also stops our own geometry() call from feeding back into another resize.
     content_height = main_frame.winfo_reqheight()
     content_width = main_frame.winfo_reqwidth()
+    if (content_width, content_height) == last_content_size:
+        return
+    last_content_size = (content_width, content_height)
 
     # Get screen dimensions
     screen_width = root.winfo_screenwidth()
@@ -1219,11 +1817,34 @@ version_entry.pack(padx=15, pady=5)
 version_entry.insert(0, "10.0.0")
 
 # Update advanced configuration fields when version changes
+VERSION_CHANGE_DEBOUNCE_MS = 250
+version_change_job_id = None
+
+# Opt-in: pulling a Jira image is several GB, so only prefetch when asked to
+prefetch_var = tk.BooleanVar(value=False)
+tk.Checkbutton(main_frame, text="Download the Jira image in the background once the version is entered",
+               variable=prefetch_var, command=lambda: on_version_confirmed() if prefetch_var.get() else cancel_prefetch()).pack(padx=15, pady=2)
+
 def on_version_change(*args):
     """Update advanced configuration fields when Jira version changes"""
+    # Debounced: refill the fields once typing pauses, not on every keystroke
+    global version_change_job_id
+    if version_change_job_id is not None:
+        root.after_cancel(version_change_job_id)
+    version_change_job_id = root.after(VERSION_CHANGE_DEBOUNCE_MS, apply_version_change)
+
+def apply_version_change():
+    global version_change_job_id
+    version_change_job_id = None
     set_advanced_defaults()
 
+def on_version_confirmed(event=None):
+    # Prefetch only once the version is confirmed (Enter or leaving the field), never for what is mid-typing
+    prefetch_jira_image(version_entry.get().strip())
+
 version_entry.bind('<KeyRelease>', on_version_change)
+version_entry.bind('<Return>', on_version_confirmed)
+version_entry.bind('<FocusOut>', on_version_confirmed)
 
 
 
@@ -1234,6 +1855,8 @@ tk.Button(button_frame, text="Install Jira", command=install_jira).pack(side=tk.
 tk.Button(button_frame, text="View Docker Status", command=view_docker_status).pack(side=tk.LEFT, padx=10, pady=5)
 tk.Button(button_frame, text="Clear Logs", command=clear_logs).pack(side=tk.LEFT, padx=10, pady=5)
 tk.Button(button_frame, text="Check for Updates", command=check_and_prompt_update).pack(side=tk.LEFT, padx=10, pady=5)
+busy_label = tk.Label(button_frame, text="", fg="gray")
+busy_label.pack(side=tk.LEFT, padx=10, pady=5)
 
 # Main content area with logs and advanced options side by side
 main_content = tk.Frame(main_frame)
@@ -1417,6 +2040,9 @@ elapsed_container.pack(fill="x")
 tk.Label(main_frame, text="Credits: João Silva (joao.silva@sembi.com)").pack(padx=10, pady=5)
 tk.Label(main_frame, text="Contact the author if you have any doubts.").pack(padx=10, pady=5)
 
-# Start UI drain loop and enter mainloop
-root.after(100, ui_drain)
+# Drain the UI queue whenever a worker posts to it, then enter mainloop
+root.bind("<<UIWork>>", ui_drain)
+root.after_idle(ui_drain)
 root.mainloop()
+# Don't leave a background pull running after the window is closed
+cancel_prefetch()